@@ -41,8 +41,12 @@ def create_deck() -> List[Card]:
     return single + list(single)  # double deck
 
 
-def shuffle_deck(deck: List[Card]) -> None:
-    random.shuffle(deck)
+def shuffle_deck(deck: List[Card], rng: Optional[random.Random] = None) -> None:
+    """
+    Shuffle deck in place, using rng if given (for reproducible deals)
+    or the global random module otherwise.
+    """
+    (rng or random).shuffle(deck)
 
 
 def deal_hands(
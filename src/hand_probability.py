@@ -0,0 +1,183 @@
+from collections import Counter
+from fractions import Fraction
+from functools import lru_cache
+from math import comb
+from typing import Dict, Iterable, List, Optional, Tuple
+from .cards import Card, SUITS, RANKS
+from .hand_eval import get_hand_features
+
+
+# Order of the feature tuple used as distribution keys
+# (same order as score_hand_tuple).
+FEATURE_NAMES = ("bowers", "trump_count", "offsuit_aces", "high_offsuit", "rank_sum")
+
+FeatureKey = Tuple[int, int, int, int, int]
+
+
+# ===========================
+#  CARD CLASSES
+# ===========================
+
+def _feature_vector(
+    card: Card,
+    contract_type: str,
+    trump_suit: Optional[str],
+) -> FeatureKey:
+    """
+    Contribution of a single card to get_hand_features.
+
+    Every feature is a sum over cards, so a hand's features are the sum of
+    its cards' vectors.
+    """
+    f = get_hand_features([card], contract_type, trump_suit)
+    return tuple(f[name] for name in FEATURE_NAMES)  # type: ignore[return-value]
+
+
+def _card_classes(
+    contract_type: str,
+    trump_suit: Optional[str],
+    unseen: Tuple[Tuple[Card, int], ...],
+) -> List[Tuple[FeatureKey, int]]:
+    """
+    Group the unseen cards by feature vector.
+
+    Returns [(vector, number_of_physical_cards), ...]; cards in the same
+    class are interchangeable as far as the features are concerned.
+    """
+    classes: Counter = Counter()
+    for card, copies in unseen:
+        if copies > 0:
+            classes[_feature_vector(card, contract_type, trump_suit)] += copies
+    return sorted(classes.items())
+
+
+# ===========================
+#  GENERATING FUNCTION
+# ===========================
+
+def _joint_distribution(
+    contract_type: str,
+    trump_suit: Optional[str],
+    unseen: Tuple[Tuple[Card, int], ...],
+    hand_size: int,
+) -> Dict[FeatureKey, Fraction]:
+    """
+    Probability of each feature key for a hand_size-card hand.
+
+    Counts hands with physical cards distinct by multiplying the per-class
+    generating functions
+        sum_k C(m, k) * x^(k * vector) * y^k
+    and keeping the y^hand_size coefficient.
+    """
+    zero: FeatureKey = (0, 0, 0, 0, 0)
+    # state: (features, cards_taken) -> number of ways
+    states: Dict[Tuple[FeatureKey, int], int] = {(zero, 0): 1}
+
+    for vector, m in _card_classes(contract_type, trump_suit, unseen):
+        nxt: Dict[Tuple[FeatureKey, int], int] = {}
+        for (feats, taken), ways in states.items():
+            for k in range(min(m, hand_size - taken) + 1):
+                key = (
+                    tuple(f + k * v for f, v in zip(feats, vector)),
+                    taken + k,
+                )
+                nxt[key] = nxt.get(key, 0) + ways * comb(m, k)  # type: ignore[index]
+        states = nxt
+
+    counts = {
+        feats: ways
+        for (feats, taken), ways in states.items()
+        if taken == hand_size
+    }
+    total = sum(counts.values())
+    return {feats: Fraction(ways, total) for feats, ways in counts.items()}
+
+
+def _unseen_key(known_cards: Iterable[Card]) -> Tuple[Tuple[Card, int], ...]:
+    """Hashable (card, copies_left) tuple for the double deck minus known_cards."""
+    known = Counter(known_cards)
+    unseen = []
+    for s in SUITS:
+        for r in RANKS:
+            card = Card(s, r)
+            left = 2 - known[card]
+            if left < 0:
+                raise ValueError(f"Card {card} appears more than twice")
+            unseen.append((card, left))
+    return tuple(unseen)
+
+
+@lru_cache(maxsize=None)
+def _full_deck_distribution(
+    contract_type: str,
+    trump_suit: Optional[str],
+    hand_size: int,
+) -> Dict[FeatureKey, Fraction]:
+    """Cached table for a hand drawn from the whole double deck."""
+    return _joint_distribution(contract_type, trump_suit, _unseen_key(()), hand_size)
+
+
+# ===========================
+#  PUBLIC API
+# ===========================
+
+def feature_distribution(
+    contract_type: str,
+    trump_suit: Optional[str] = None,
+    known_cards: Iterable[Card] = (),
+    hand_size: int = 10,
+) -> Dict[FeatureKey, Fraction]:
+    """
+    Exact joint distribution of get_hand_features for a random hand.
+
+    The hand is hand_size cards drawn uniformly from the double deck minus
+    known_cards. With no known cards this is a freshly dealt 10-card hand;
+    pass your own hand to get a partner's or one opponent's holding, or
+    hand_size=20 for both opponents combined.
+
+    Keys are (bowers, trump_count, offsuit_aces, high_offsuit, rank_sum),
+    see FEATURE_NAMES. Values are exact Fractions summing to 1.
+    Tables with no known cards are cached per (contract, hand_size);
+    tables given known cards are computed on demand (tens of ms).
+    """
+    if contract_type not in ("suit", "high", "low"):
+        raise ValueError(f"Unknown contract_type: {contract_type}")
+    if contract_type == "suit" and trump_suit is None:
+        raise ValueError("trump_suit must be provided for 'suit' contracts")
+    if contract_type in ("high", "low") and trump_suit is not None:
+        raise ValueError("trump_suit must be None for 'high'/'low' contracts")
+
+    unseen = _unseen_key(known_cards)
+    available = sum(copies for _, copies in unseen)
+    if not 0 <= hand_size <= available:
+        raise ValueError(
+            f"hand_size must be between 0 and {available} unseen cards"
+        )
+
+    if all(copies == 2 for _, copies in unseen):
+        # Copy so callers can't mutate the cached table
+        return dict(_full_deck_distribution(contract_type, trump_suit, hand_size))
+    return _joint_distribution(contract_type, trump_suit, unseen, hand_size)
+
+
+def marginal_distribution(
+    feature: str,
+    contract_type: str,
+    trump_suit: Optional[str] = None,
+    known_cards: Iterable[Card] = (),
+    hand_size: int = 10,
+) -> Dict[int, Fraction]:
+    """
+    Exact distribution of a single feature, e.g. "trump_count" or "bowers".
+
+    Same arguments as feature_distribution.
+    """
+    if feature not in FEATURE_NAMES:
+        raise ValueError(f"Unknown hand feature: {feature}")
+    idx = FEATURE_NAMES.index(feature)
+
+    joint = feature_distribution(contract_type, trump_suit, known_cards, hand_size)
+    marginal: Dict[int, Fraction] = {}
+    for feats, p in joint.items():
+        marginal[feats[idx]] = marginal.get(feats[idx], Fraction(0)) + p
+    return dict(sorted(marginal.items()))
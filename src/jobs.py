@@ -0,0 +1,334 @@
+import argparse
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple
+from .simulation import hand_rng, play_single_hand
+
+
+# Files inside a job directory:
+#   job.json          -- the job parameters (shared by every shard)
+#   shard-0000.json   -- checkpoint / final state of shard 0, etc.
+JOB_FILE = "job.json"
+
+
+class ShardsPending(Exception):
+    """Raised by merge_shards while some shards are missing or unfinished."""
+
+    def __init__(self, pending: List[int]) -> None:
+        super().__init__(f"Shards not finished yet: {pending}")
+        self.pending = pending
+
+
+def _shard_file(job_dir: str, shard_index: int) -> str:
+    return os.path.join(job_dir, f"shard-{shard_index:04d}.json")
+
+
+def _write_temp_json(path: str, data: Dict) -> str:
+    """
+    Write data to a uniquely named temp file next to path.
+
+    Unique names keep machines sharing a directory from clobbering each
+    other's temp files. Returns the temp path.
+    """
+    fd, tmp = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".",
+        suffix=".tmp",
+        dir=os.path.dirname(path) or ".",
+    )
+    try:
+        os.fchmod(fd, 0o644)  # mkstemp files are private by default
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return tmp
+
+
+def _write_json(path: str, data: Dict) -> None:
+    """Write atomically so an interrupted run never leaves a torn file."""
+    os.replace(_write_temp_json(path, data), path)
+
+
+def _create_json(path: str, data: Dict) -> None:
+    """
+    Atomically create path with data.
+
+    Raises FileExistsError if another writer created it first.
+    """
+    tmp = _write_temp_json(path, data)
+    try:
+        os.link(tmp, path)
+    finally:
+        os.unlink(tmp)
+
+
+def _read_json(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+# ================================
+#        JOB LAYOUT
+# ================================
+
+def plan_shards(n: int, num_shards: int) -> List[Tuple[int, int]]:
+    """
+    Split hands 0..n-1 into num_shards contiguous [start, stop) ranges.
+
+    The split depends only on (n, num_shards), so every machine computes
+    the same plan.
+    """
+    if n <= 0:
+        raise ValueError("n must be positive")
+    if not 1 <= num_shards <= n:
+        raise ValueError("num_shards must be between 1 and n")
+
+    base, extra = divmod(n, num_shards)
+    ranges = []
+    start = 0
+    for i in range(num_shards):
+        stop = start + base + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def init_job(
+    job_dir: str,
+    n: int,
+    contract_type: str,
+    trump_suit: Optional[str] = None,
+    seed: int = 0,
+    num_shards: int = 1,
+) -> Dict:
+    """
+    Create job_dir and its job.json, or check an existing one matches.
+
+    Safe to call from every machine sharing job_dir.
+    """
+    if contract_type == "suit" and trump_suit is None:
+        raise ValueError("trump_suit must be provided for 'suit' contracts")
+    if contract_type in ("high", "low") and trump_suit is not None:
+        raise ValueError("trump_suit must be None for 'high'/'low' contracts")
+
+    job = {
+        "hands": n,
+        "contract_type": contract_type,
+        "trump_suit": trump_suit,
+        "seed": seed,
+        "num_shards": num_shards,
+    }
+    plan_shards(n, num_shards)  # validate before touching the disk
+
+    os.makedirs(job_dir, exist_ok=True)
+    path = os.path.join(job_dir, JOB_FILE)
+    try:
+        _create_json(path, job)
+    except FileExistsError:
+        # Another machine (or an earlier run) created the job first
+        existing = _read_json(path)
+        if existing != job:
+            raise ValueError(
+                f"{path} describes a different job: {existing} != {job}"
+            )
+    return job
+
+
+def load_job(job_dir: str) -> Dict:
+    return _read_json(os.path.join(job_dir, JOB_FILE))
+
+
+# ================================
+#        RUNNING SHARDS
+# ================================
+
+def run_shard(
+    job_dir: str,
+    shard_index: int,
+    checkpoint_every: int = 1000,
+) -> Dict:
+    """
+    Play one shard's hands, resuming from its checkpoint if there is one.
+
+    Hand i is always dealt from hand_rng(seed, i), so a resumed shard
+    produces exactly what an uninterrupted one would. The shard state
+    (next hand, trick totals, Team 0 histogram) is written every
+    checkpoint_every hands and when the shard finishes.
+
+    A shard should be run by one worker at a time.
+
+    Returns the shard state dict.
+    """
+    if checkpoint_every <= 0:
+        raise ValueError("checkpoint_every must be positive")
+
+    job = load_job(job_dir)
+    if not 0 <= shard_index < job["num_shards"]:
+        raise ValueError(
+            f"shard_index must be between 0 and {job['num_shards'] - 1}"
+        )
+    start, stop = plan_shards(job["hands"], job["num_shards"])[shard_index]
+    path = _shard_file(job_dir, shard_index)
+
+    if os.path.exists(path):
+        state = _read_json(path)
+        if (state["start"], state["stop"]) != (start, stop):
+            raise ValueError(f"{path} does not match the job's shard plan")
+    else:
+        state = {
+            "shard": shard_index,
+            "start": start,
+            "stop": stop,
+            "next_hand": start,
+            "total0": 0,
+            "total1": 0,
+            "distribution_team0": [0] * 11,  # possible tricks 0–10
+        }
+
+    since_checkpoint = 0
+    while state["next_hand"] < stop:
+        i = state["next_hand"]
+        t0, t1 = play_single_hand(
+            job["contract_type"],
+            job["trump_suit"],
+            hand_rng(job["seed"], i),
+        )
+        state["total0"] += t0
+        state["total1"] += t1
+        state["distribution_team0"][t0] += 1
+        state["next_hand"] = i + 1
+
+        since_checkpoint += 1
+        if since_checkpoint >= checkpoint_every:
+            _write_json(path, state)
+            since_checkpoint = 0
+
+    _write_json(path, state)
+    return state
+
+
+def merge_shards(job_dir: str) -> Dict:
+    """
+    Combine all finished shards into the simulate_many_hands result dict.
+
+    With the same seed the result equals simulate_many_hands(..., seed=seed)
+    regardless of how many shards or machines were used.
+
+    Raises ShardsPending (listing the shard indices) if any shard is
+    missing or unfinished.
+    """
+    job = load_job(job_dir)
+    n = job["hands"]
+
+    total0 = 0
+    total1 = 0
+    dist_team0 = {i: 0 for i in range(11)}
+
+    pending: List[int] = []
+
+    for shard_index, (_, stop) in enumerate(plan_shards(n, job["num_shards"])):
+        path = _shard_file(job_dir, shard_index)
+        if not os.path.exists(path):
+            pending.append(shard_index)
+            continue
+        state = _read_json(path)
+        if state["next_hand"] != stop:
+            pending.append(shard_index)
+            continue
+
+        total0 += state["total0"]
+        total1 += state["total1"]
+        for k, count in enumerate(state["distribution_team0"]):
+            dist_team0[k] += count
+
+    if pending:
+        raise ShardsPending(pending)
+
+    return {
+        "hands": n,
+        "contract_type": job["contract_type"],
+        "trump_suit": job["trump_suit"],
+        "avg_team0": total0 / n,
+        "avg_team1": total1 / n,
+        "distribution_team0": dist_team0,
+    }
+
+
+def run_job(
+    job_dir: str,
+    n: int,
+    contract_type: str,
+    trump_suit: Optional[str] = None,
+    seed: int = 0,
+    num_shards: int = 1,
+    shards: Optional[Sequence[int]] = None,
+    checkpoint_every: int = 1000,
+) -> Optional[Dict]:
+    """
+    Run (or resume) the given shards of a job; all shards by default.
+
+    To spread a job across machines, point each one at the same shared
+    job_dir with a different `shards` list.
+
+    Returns the merged result once every shard is finished, else None.
+    """
+    job = init_job(job_dir, n, contract_type, trump_suit, seed, num_shards)
+
+    if shards is None:
+        shards = range(job["num_shards"])
+    for shard_index in shards:
+        run_shard(job_dir, shard_index, checkpoint_every)
+
+    try:
+        return merge_shards(job_dir)
+    except ShardsPending:
+        return None  # other shards still pending elsewhere
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Run a checkpointed, sharded simulate_many_hands job.",
+    )
+    parser.add_argument("job_dir")
+    parser.add_argument("--hands", type=int, required=True)
+    parser.add_argument("--contract", choices=["suit", "high", "low"], required=True)
+    parser.add_argument("--trump", choices=["C", "D", "H", "S"], default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--num-shards", type=int, default=1)
+    parser.add_argument(
+        "--shards", type=int, nargs="*", default=None,
+        help="shard indices to run on this machine (default: all)",
+    )
+    parser.add_argument("--checkpoint-every", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    if args.shards is not None:
+        bad = [i for i in args.shards if not 0 <= i < args.num_shards]
+        if bad:
+            parser.error(
+                f"--shards must be between 0 and {args.num_shards - 1}: {bad}"
+            )
+
+    results = run_job(
+        args.job_dir,
+        n=args.hands,
+        contract_type=args.contract,
+        trump_suit=args.trump,
+        seed=args.seed,
+        num_shards=args.num_shards,
+        shards=args.shards,
+        checkpoint_every=args.checkpoint_every,
+    )
+
+    if results is None:
+        print("Shards done; waiting on other shards before merging.")
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
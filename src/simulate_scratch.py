@@ -2,6 +2,7 @@ from typing import Optional
 from .cards import create_deck, shuffle_deck, deal_hands
 from .rules import trick_winner
 from .strategy import choose_card_basic
+from .tracker import CardTracker
 
 
 def play_full_hand(contract_type: str, trump_suit: Optional[str] = None):
@@ -16,6 +17,7 @@ def play_full_hand(contract_type: str, trump_suit: Optional[str] = None):
     # team 0 = players 0 and 2
     # team 1 = players 1 and 3
     team_tricks = {0: 0, 1: 0}
+    tracker = CardTracker(contract_type, trump_suit)
 
     leader = 0  # player who leads first trick
 
@@ -34,8 +36,10 @@ def play_full_hand(contract_type: str, trump_suit: Optional[str] = None):
                 contract_type=contract_type,
                 trump_suit=trump_suit,
                 player_index=player,
+                tracker=tracker,
             )
             card = hand.pop(card_index)
+            tracker.record_play(player, card, plays)
             plays.append((player, card))
             print(f"Player {player} plays {card}")
 
@@ -1,18 +1,35 @@
-from typing import Dict, Tuple, Optional, List
-from .cards import create_deck, shuffle_deck, deal_hands, Card
+from typing import Dict, Tuple, Optional, List, Sequence
+import random
+from .cards import create_deck, shuffle_deck, deal_hands, effective_suit, Card
 from .rules import trick_winner
-from .strategy import choose_card_basic
+from .strategy import Strategy, accepts_tracker, choose_card_basic
+from .tracker import CardTracker
+
+
+def hand_rng(seed: int, hand_index: int) -> random.Random:
+    """
+    Independent RNG substream for hand number hand_index of a seeded run.
+
+    Each hand gets its own stream, so any range of hands can be replayed
+    (or split into shards) without playing the hands before it.
+    """
+    return random.Random(f"{seed}:{hand_index}")
 
 
 def play_single_hand(
     contract_type: str,
     trump_suit: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+    strategies: Optional[Sequence[Strategy]] = None,
 ) -> Tuple[int, int]:
     """
-    Play one full 10-trick hand with the basic bot.
+    Play one full 10-trick hand from a fresh deal.
 
     contract_type: "suit", "high", or "low"
     trump_suit: required for "suit", must be None for "high"/"low"
+    rng: optional RNG for the shuffle; defaults to the global random module.
+    strategies: optional per-seat strategies (see play_dealt_hand);
+        defaults to the basic bot in every seat.
 
     Returns:
         (team0_tricks, team1_tricks)
@@ -20,18 +37,52 @@ def play_single_hand(
         team 0 = players 0 and 2
         team 1 = players 1 and 3
     """
+    deck: List[Card] = create_deck()
+    shuffle_deck(deck, rng)
+    hands = deal_hands(deck, num_players=4, hand_size=10)
+
+    return play_dealt_hand(hands, contract_type, trump_suit, strategies)
+
+
+def play_dealt_hand(
+    hands: List[List[Card]],
+    contract_type: str,
+    trump_suit: Optional[str] = None,
+    strategies: Optional[Sequence[Strategy]] = None,
+) -> Tuple[int, int]:
+    """
+    Play out 10 tricks from already-dealt hands (consumed in place).
+
+    strategies: one strategy per seat 0..3, each with the choose_card_basic
+    signature; defaults to choose_card_basic in every seat. Only strategies
+    that accept a `tracker` keyword are passed the CardTracker.
+
+    Raises ValueError if a strategy returns an out-of-range index or
+    fails to follow the led suit while holding it.
+
+    Returns (team0_tricks, team1_tricks) as in play_single_hand.
+    """
     if contract_type == "suit" and trump_suit is None:
         raise ValueError("trump_suit must be provided for 'suit' contracts")
     if contract_type in ("high", "low") and trump_suit is not None:
         raise ValueError("trump_suit must be None for 'high'/'low' contracts")
 
-    deck: List[Card] = create_deck()
-    shuffle_deck(deck)
-    hands = deal_hands(deck, num_players=4, hand_size=10)
+    if strategies is None:
+        strategies = [choose_card_basic] * 4
+    if len(strategies) != 4:
+        raise ValueError("strategies must give one strategy per seat")
 
     team_tricks = {0: 0, 1: 0}
     leader = 0  # player who leads the first trick
 
+    # Updated once per play; handed as optional context to the strategies
+    # that ask for it (checked once per seat, not per move)
+    tracker = CardTracker(contract_type, trump_suit)
+    seat_kwargs = [
+        {"tracker": tracker} if accepts_tracker(s) else {}
+        for s in strategies
+    ]
+
     # 10 tricks in a 10-card hand
     for _ in range(10):
         plays = []
@@ -41,14 +92,20 @@ def play_single_hand(
             player = (leader + offset) % 4
             hand = hands[player]
 
-            card_index = choose_card_basic(
+            card_index = strategies[player](
                 hand=hand,
                 plays_so_far=plays,
                 contract_type=contract_type,
                 trump_suit=trump_suit,
                 player_index=player,
+                **seat_kwargs[player],
+            )
+            _check_legal_play(
+                strategies[player], player, hand, card_index,
+                plays, contract_type, trump_suit,
             )
             card = hand.pop(card_index)
+            tracker.record_play(player, card, plays)
             plays.append((player, card))
 
         winner = trick_winner(
@@ -68,14 +125,51 @@ def play_single_hand(
     return team_tricks[0], team_tricks[1]
 
 
+def _check_legal_play(
+    strategy: Strategy,
+    player: int,
+    hand: List[Card],
+    card_index: int,
+    plays: List[Tuple[int, Card]],
+    contract_type: str,
+    trump_suit: Optional[str],
+) -> None:
+    """Reject an out-of-range index or a revoke (not following suit when able)."""
+    name = getattr(strategy, "__name__", repr(strategy))
+
+    if not isinstance(card_index, int) or not 0 <= card_index < len(hand):
+        raise ValueError(
+            f"{name} (player {player}) returned card index {card_index!r} "
+            f"for a {len(hand)}-card hand"
+        )
+
+    if not plays:
+        return  # any card may be led
+
+    led_suit = effective_suit(plays[0][1], trump_suit, contract_type)
+    card = hand[card_index]
+    if effective_suit(card, trump_suit, contract_type) != led_suit and any(
+        effective_suit(c, trump_suit, contract_type) == led_suit for c in hand
+    ):
+        raise ValueError(
+            f"{name} (player {player}) played {card} but must follow "
+            f"{led_suit} from {hand}"
+        )
+
+
 def simulate_many_hands(
     n: int,
     contract_type: str,
     trump_suit: Optional[str] = None,
+    seed: Optional[int] = None,
 ) -> Dict:
     """
     Run Monte Carlo simulation of n hands.
 
+    seed: if given, hand i is dealt from hand_rng(seed, i), making the run
+    reproducible and identical to a sharded job (see jobs.py) with the
+    same seed.
+
     Returns a summary dict:
         {
             "hands": n,
@@ -91,8 +185,9 @@ def simulate_many_hands(
     total0 = 0
     total1 = 0
 
-    for _ in range(n):
-        t0, t1 = play_single_hand(contract_type, trump_suit)
+    for i in range(n):
+        rng = hand_rng(seed, i) if seed is not None else None
+        t0, t1 = play_single_hand(contract_type, trump_suit, rng)
         total0 += t0
         total1 += t1
         dist_team0[t0] += 1
@@ -1,5 +1,38 @@
-from typing import List, Tuple, Optional
+import inspect
+from typing import List, Tuple, Optional, Protocol
 from .cards import Card, effective_suit, rank_strength
+from .tracker import CardTracker
+
+
+class Strategy(Protocol):
+    """
+    A card-play bot. Returns the index in hand of the card to play.
+
+    Called with keyword arguments. Strategies that also declare a `tracker`
+    keyword (or **kwargs) receive the hand's CardTracker; others are called
+    without it (see accepts_tracker).
+    """
+
+    def __call__(
+        self,
+        hand: List[Card],
+        plays_so_far: List[Tuple[int, Card]],
+        contract_type: str,
+        trump_suit: Optional[str],
+        player_index: int,
+    ) -> int: ...
+
+
+def accepts_tracker(strategy: Strategy) -> bool:
+    """True if strategy can be called with a `tracker=` keyword."""
+    try:
+        params = inspect.signature(strategy).parameters.values()
+    except (TypeError, ValueError):
+        return False  # no introspectable signature; don't risk it
+    return any(
+        p.name == "tracker" or p.kind is inspect.Parameter.VAR_KEYWORD
+        for p in params
+    )
 
 
 def choose_card_basic(
@@ -8,6 +41,7 @@ def choose_card_basic(
     contract_type: str,
     trump_suit: Optional[str],
     player_index: int,
+    tracker: Optional[CardTracker] = None,
 ) -> int:
     """
     Very simple bot:
@@ -17,6 +51,9 @@ def choose_card_basic(
     Works for:
       - "suit" contracts (with trump_suit)
       - "high" and "low" contracts (no trump_suit)
+
+    tracker: optional CardTracker with the cards played so far this hand.
+    Card-counting strategies can query it; this bot ignores it.
     """
 
     # Determine led suit
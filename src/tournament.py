@@ -0,0 +1,214 @@
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from .cards import create_deck, shuffle_deck, deal_hands
+from .simulation import hand_rng, play_dealt_hand
+from .strategy import Strategy, accepts_tracker, choose_card_basic
+
+
+# Contracts played in every tournament: (contract_type, trump_suit, label)
+CONTRACTS = [
+    ("high", None, "High no-trump"),
+    ("low", None, "Low no-trump"),
+] + [
+    ("suit", suit, f"Suit contract, trump={suit}")
+    for suit in ["C", "D", "H", "S"]
+]
+
+
+class _TimedStrategy:
+    """Wraps a strategy and accumulates wall time spent deciding."""
+
+    def __init__(self, strategy: Strategy) -> None:
+        self.strategy = strategy
+        self.__name__ = getattr(strategy, "__name__", repr(strategy))
+        self.wants_tracker = accepts_tracker(strategy)
+        self.seconds = 0.0
+        self.decisions = 0
+
+    def __call__(self, **kwargs) -> int:
+        if not self.wants_tracker:
+            kwargs.pop("tracker", None)
+        t = time.perf_counter()
+        card_index = self.strategy(**kwargs)
+        self.seconds += time.perf_counter() - t
+        self.decisions += 1
+        return card_index
+
+
+def _play_duplicate_batch(
+    strategy_a: Strategy,
+    strategy_b: Strategy,
+    contract_type: str,
+    trump_suit: Optional[str],
+    seed: int,
+    start: int,
+    stop: int,
+) -> Tuple[List[int], Tuple[float, int], Tuple[float, int]]:
+    """
+    Play deals start..stop-1 of one contract twice each (worker entry point).
+
+    Table 1: A holds seats 0 & 2, B holds seats 1 & 3.
+    Table 2: the same cards with the partnerships swapped.
+
+    The per-deal score is A's tricks on seats 0 & 2 minus B's tricks on the
+    same seats, so the luck of the cards cancels out.
+
+    Returns (scores, (a_seconds, a_decisions), (b_seconds, b_decisions)).
+    """
+    timed_a = _TimedStrategy(strategy_a)
+    timed_b = _TimedStrategy(strategy_b)
+
+    scores: List[int] = []
+    for i in range(start, stop):
+        deck = create_deck()
+        shuffle_deck(deck, hand_rng(seed, i))
+        hands = deal_hands(deck, num_players=4, hand_size=10)
+
+        a_tricks, _ = play_dealt_hand(
+            [list(h) for h in hands], contract_type, trump_suit,
+            [timed_a, timed_b, timed_a, timed_b],
+        )
+        b_tricks, _ = play_dealt_hand(
+            [list(h) for h in hands], contract_type, trump_suit,
+            [timed_b, timed_a, timed_b, timed_a],
+        )
+        scores.append(a_tricks - b_tricks)
+
+    return (
+        scores,
+        (timed_a.seconds, timed_a.decisions),
+        (timed_b.seconds, timed_b.decisions),
+    )
+
+
+def _mean_and_stderr(values: Sequence[int]) -> Tuple[float, float]:
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return mean, float("nan")
+    var = sum((v - mean) ** 2 for v in values) / (n - 1)
+    return mean, math.sqrt(var / n)
+
+
+def run_duplicate_tournament(
+    strategy_a: Strategy,
+    strategy_b: Strategy,
+    n_deals: int = 1000,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    batch_size: int = 250,
+    names: Optional[Tuple[str, str]] = None,
+) -> Dict:
+    """
+    Compare two strategies in duplicate format over every contract.
+
+    Each deal is played twice with the partnerships swapped (see
+    _play_duplicate_batch). Deal i is dealt from hand_rng(seed, i), so
+    results are reproducible for a given seed.
+
+    strategy_a, strategy_b: callables with the choose_card_basic signature;
+        the `tracker` keyword is optional (see Strategy). They must be
+        picklable (module-level functions) when workers != 1. An illegal
+        play raises ValueError naming the bot.
+    workers: process pool size (None = one per CPU); 1 runs in-process.
+    batch_size: deals per pool task.
+    names: labels for the report; defaults to the functions' __name__.
+
+    Returns a summary dict:
+        {
+            "deals": n_deals,
+            "bots": (name_a, name_b),
+            "contracts": {
+                label: {
+                    "contract_type": str,
+                    "trump_suit": str or None,
+                    "mean_diff": float,   # A's tricks minus B's, per deal
+                    "std_err": float,
+                },
+            },
+            "time_per_decision": {name_a: seconds, name_b: seconds},
+        }
+    """
+    if n_deals <= 0:
+        raise ValueError("n_deals must be positive")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    if names is None:
+        names = (
+            getattr(strategy_a, "__name__", "A"),
+            getattr(strategy_b, "__name__", "B"),
+        )
+    if names[0] == names[1]:
+        names = (f"{names[0]} (A)", f"{names[1]} (B)")
+
+    tasks = [
+        (strategy_a, strategy_b, contract_type, trump_suit, seed,
+         start, min(start + batch_size, n_deals))
+        for contract_type, trump_suit, _ in CONTRACTS
+        for start in range(0, n_deals, batch_size)
+    ]
+
+    if workers == 1:
+        batches = [_play_duplicate_batch(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batches = list(pool.map(_play_duplicate_batch, *zip(*tasks)))
+
+    scores: Dict[str, List[int]] = {label: [] for _, _, label in CONTRACTS}
+    labels = {(c, t): label for c, t, label in CONTRACTS}
+    seconds = [0.0, 0.0]
+    decisions = [0, 0]
+
+    for task, (batch_scores, (a_sec, a_dec), (b_sec, b_dec)) in zip(tasks, batches):
+        scores[labels[(task[2], task[3])]].extend(batch_scores)
+        seconds[0] += a_sec
+        seconds[1] += b_sec
+        decisions[0] += a_dec
+        decisions[1] += b_dec
+
+    contracts = {}
+    for contract_type, trump_suit, label in CONTRACTS:
+        mean, stderr = _mean_and_stderr(scores[label])
+        contracts[label] = {
+            "contract_type": contract_type,
+            "trump_suit": trump_suit,
+            "mean_diff": mean,
+            "std_err": stderr,
+        }
+
+    return {
+        "deals": n_deals,
+        "bots": names,
+        "contracts": contracts,
+        "time_per_decision": {
+            names[0]: seconds[0] / decisions[0],
+            names[1]: seconds[1] / decisions[1],
+        },
+    }
+
+
+def print_tournament(results: Dict) -> None:
+    name_a, name_b = results["bots"]
+
+    print("\n========================================")
+    print(f"Duplicate tournament: {name_a} vs {name_b}")
+    print("========================================")
+    print("Deals per contract:", results["deals"])
+
+    print(f"\nTrick difference ({name_a} minus {name_b}, per deal):")
+    for label, r in results["contracts"].items():
+        print(f"  {label:26s} {r['mean_diff']:+.3f} ± {r['std_err']:.3f}")
+
+    print("\nTime per decision:")
+    for name, sec in results["time_per_decision"].items():
+        print(f"  {name}: {sec * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    # Sanity check: a bot against itself should score exactly 0.
+    print_tournament(
+        run_duplicate_tournament(choose_card_basic, choose_card_basic, n_deals=1000)
+    )
@@ -0,0 +1,165 @@
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from .cards import (
+    Card,
+    SUITS,
+    RANKS,
+    effective_suit,
+    is_right_bower,
+    is_left_bower,
+    rank_strength,
+)
+
+
+def _suit_order(
+    suit: str,
+    contract_type: str,
+    trump_suit: Optional[str],
+) -> List[Card]:
+    """
+    Distinct cards whose effective suit is `suit`, strongest first.
+
+    In suit contracts the trump suit gains both bowers on top and the
+    same-color suit loses its jack (it plays as the left bower).
+    """
+    members = [
+        Card(s, r)
+        for s in SUITS
+        for r in RANKS
+        if effective_suit(Card(s, r), trump_suit, contract_type) == suit
+    ]
+
+    def strength(card: Card) -> Tuple[int, int]:
+        if contract_type == "suit" and trump_suit is not None:
+            if is_right_bower(card, trump_suit):
+                return (2, 0)
+            if is_left_bower(card, trump_suit):
+                return (1, 0)
+        return (0, rank_strength(card, contract_type))
+
+    return sorted(members, key=strength, reverse=True)
+
+
+class CardTracker:
+    """
+    Incremental record of everything played so far in one hand.
+
+    The simulator calls record_play() once per card; strategies receive the
+    tracker as optional context and can query it in O(1):
+
+      - voids shown by each seat (by effective suit)
+      - outstanding copies of each card (2 per card in the double deck)
+      - highest outstanding card per effective suit, bowers included
+      - how many trump cards are still outstanding
+
+    "Outstanding" means not yet played; it includes cards still held by the
+    player asking.
+    """
+
+    def __init__(
+        self,
+        contract_type: str,
+        trump_suit: Optional[str] = None,
+        num_players: int = 4,
+    ) -> None:
+        if contract_type not in ("suit", "high", "low"):
+            raise ValueError(f"Unknown contract_type: {contract_type}")
+        if contract_type == "suit" and trump_suit is None:
+            raise ValueError("trump_suit must be provided for 'suit' contracts")
+        if contract_type in ("high", "low") and trump_suit is not None:
+            raise ValueError("trump_suit must be None for 'high'/'low' contracts")
+
+        self.contract_type = contract_type
+        self.trump_suit = trump_suit
+
+        # 2 copies of every (suit, rank) in the double deck
+        self._remaining: Dict[Card, int] = {
+            Card(s, r): 2 for s in SUITS for r in RANKS
+        }
+        self._suit_remaining: Dict[str, int] = {s: 0 for s in SUITS}
+        for card, count in self._remaining.items():
+            self._suit_remaining[self._eff(card)] += count
+
+        # Per-suit strongest-first order plus a cursor to the highest
+        # card that still has a copy outstanding.
+        self._order: Dict[str, List[Card]] = {
+            s: _suit_order(s, self.contract_type, self.trump_suit)
+            for s in SUITS
+        }
+        self._top: Dict[str, int] = {s: 0 for s in SUITS}
+
+        self._voids: List[Set[str]] = [set() for _ in range(num_players)]
+
+    def _eff(self, card: Card) -> str:
+        return effective_suit(card, self.trump_suit, self.contract_type)
+
+    # ----------------
+    #    UPDATES
+    # ----------------
+
+    def record_play(
+        self,
+        player_index: int,
+        card: Card,
+        plays_so_far: List[Tuple[int, Card]],
+    ) -> None:
+        """
+        Record that player_index played card.
+
+        plays_so_far: the trick's plays BEFORE this card (empty on the lead).
+        A player who does not follow the led suit is marked void in it.
+        """
+        if self._remaining.get(card, 0) <= 0:
+            raise ValueError(f"Card {card} has already been played twice")
+
+        eff_suit = self._eff(card)
+
+        if plays_so_far:
+            _, lead_card = plays_so_far[0]
+            led_suit = self._eff(lead_card)
+            if eff_suit != led_suit:
+                self._voids[player_index].add(led_suit)
+
+        self._remaining[card] -= 1
+        self._suit_remaining[eff_suit] -= 1
+
+        # Advance the cursor past cards with no copies left
+        order = self._order[eff_suit]
+        top = self._top[eff_suit]
+        while top < len(order) and self._remaining[order[top]] == 0:
+            top += 1
+        self._top[eff_suit] = top
+
+    # ----------------
+    #    QUERIES
+    # ----------------
+
+    def is_void(self, player_index: int, suit: str) -> bool:
+        """True if player_index has failed to follow the effective suit."""
+        return suit in self._voids[player_index]
+
+    def voids(self, player_index: int) -> FrozenSet[str]:
+        """All effective suits player_index has shown void in."""
+        return frozenset(self._voids[player_index])
+
+    def remaining(self, card: Card) -> int:
+        """Outstanding copies of card (0, 1 or 2)."""
+        return self._remaining[card]
+
+    def remaining_in_suit(self, suit: str) -> int:
+        """Outstanding cards (copies counted) whose effective suit is suit."""
+        return self._suit_remaining[suit]
+
+    def highest_remaining(self, suit: str) -> Optional[Card]:
+        """
+        Strongest outstanding card of the effective suit under the active
+        contract, or None if the suit is exhausted.
+        """
+        order = self._order[suit]
+        top = self._top[suit]
+        return order[top] if top < len(order) else None
+
+    def trump_remaining(self) -> int:
+        """Outstanding trump cards, bowers included (0 in no-trump)."""
+        if self.trump_suit is None:
+            return 0
+        return self._suit_remaining[self.trump_suit]
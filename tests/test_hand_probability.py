@@ -0,0 +1,74 @@
+from collections import Counter
+from fractions import Fraction
+from itertools import combinations
+from math import comb
+
+import pytest
+
+from src.cards import create_deck, shuffle_deck, effective_suit
+from src.hand_eval import get_hand_features
+from src.hand_probability import FEATURE_NAMES, feature_distribution, marginal_distribution
+from src.simulation import hand_rng
+
+
+def test_trump_count_is_hypergeometric():
+    # 12 trump under H: 10 hearts plus both left bowers (J♦)
+    dist = marginal_distribution("trump_count", "suit", "H")
+    assert dist == {
+        k: Fraction(comb(12, k) * comb(28, 10 - k), comb(40, 10))
+        for k in range(11)
+    }
+
+
+def test_bowers_is_hypergeometric():
+    dist = marginal_distribution("bowers", "suit", "H")
+    assert dist == {
+        k: Fraction(comb(4, k) * comb(36, 10 - k), comb(40, 10))
+        for k in range(5)
+    }
+
+
+def test_known_cards_distribution_sums_to_one():
+    my_hand, _ = _seeded_hand(5)
+
+    for hand_size in (10, 20):
+        dist = feature_distribution("suit", "S", my_hand, hand_size)
+        assert sum(dist.values()) == 1
+
+
+def _seeded_hand(seed):
+    deck = create_deck()
+    shuffle_deck(deck, hand_rng(seed, 0))
+    return deck[:10], deck[10:]
+
+
+def test_known_hand_trump_count_is_hypergeometric():
+    my_hand, _ = _seeded_hand(5)
+    my_trump = sum(effective_suit(c, "S", "suit") == "S" for c in my_hand)
+    trump_left = 12 - my_trump
+
+    dist = marginal_distribution("trump_count", "suit", "S", my_hand)
+    assert dist == {
+        k: Fraction(comb(trump_left, k) * comb(30 - trump_left, 10 - k), comb(30, 10))
+        for k in range(min(trump_left, 10) + 1)
+    }
+
+
+@pytest.mark.parametrize("contract_type, trump_suit", [("suit", "D"), ("low", None)])
+def test_known_hand_joint_matches_enumeration(contract_type, trump_suit):
+    my_hand, unseen = _seeded_hand(9)
+
+    for hand_size in (2, 3):
+        counts = Counter()
+        for cards in combinations(unseen, hand_size):
+            f = get_hand_features(list(cards), contract_type, trump_suit)
+            counts[tuple(f[name] for name in FEATURE_NAMES)] += 1
+        total = comb(len(unseen), hand_size)
+        expected = {k: Fraction(v, total) for k, v in counts.items()}
+
+        assert feature_distribution(contract_type, trump_suit, my_hand, hand_size) == expected
+
+
+def test_no_trump_contract_rejects_trump_suit():
+    with pytest.raises(ValueError):
+        feature_distribution("high", "H")
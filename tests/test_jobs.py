@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+import src.jobs as jobs
+from src.jobs import ShardsPending, init_job, merge_shards, run_job, run_shard
+from src.simulation import play_single_hand, simulate_many_hands
+
+
+def test_sharded_job_matches_single_run(tmp_path):
+    expected = simulate_many_hands(300, "suit", "H", seed=7)
+
+    result = run_job(
+        str(tmp_path), 300, "suit", "H", seed=7, num_shards=3, checkpoint_every=25,
+    )
+    assert result == expected
+
+
+def test_resumed_job_matches_single_run(tmp_path, monkeypatch):
+    job_dir = str(tmp_path)
+    expected = simulate_many_hands(300, "high", seed=3)
+    init_job(job_dir, 300, "high", None, seed=3, num_shards=3)
+
+    # Interrupt shard 1 partway through, after a few checkpoints
+    calls = []
+
+    def interrupted(*args):
+        calls.append(args)
+        if len(calls) == 57:
+            raise KeyboardInterrupt
+        return play_single_hand(*args)
+
+    monkeypatch.setattr(jobs, "play_single_hand", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        run_shard(job_dir, 1, checkpoint_every=20)
+    monkeypatch.undo()
+
+    with open(tmp_path / "shard-0001.json") as f:
+        assert json.load(f)["next_hand"] == 100 + 40
+
+    assert run_job(job_dir, 300, "high", None, seed=3, num_shards=3, shards=[0]) is None
+    with pytest.raises(ShardsPending) as info:
+        merge_shards(job_dir)
+    assert info.value.pending == [1, 2]
+
+    result = run_job(
+        job_dir, 300, "high", None, seed=3, num_shards=3, checkpoint_every=20,
+    )
+    assert result == expected
+
+
+def test_bad_shard_index_rejected(tmp_path):
+    job_dir = str(tmp_path)
+    init_job(job_dir, 30, "low", None, seed=0, num_shards=3)
+
+    for bad in (-1, 3):
+        with pytest.raises(ValueError):
+            run_shard(job_dir, bad)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["job.json"]
+
+
+def test_corrupt_shard_is_not_pending(tmp_path):
+    job_dir = str(tmp_path)
+    init_job(job_dir, 30, "low", None, seed=0, num_shards=2)
+    run_shard(job_dir, 0)
+    (tmp_path / "shard-0001.json").write_text("{truncated")
+
+    with pytest.raises(json.JSONDecodeError):
+        merge_shards(job_dir)
+
+
+def test_different_job_in_same_dir_rejected(tmp_path):
+    init_job(str(tmp_path), 30, "suit", "H", seed=0, num_shards=2)
+    init_job(str(tmp_path), 30, "suit", "H", seed=0, num_shards=2)
+    with pytest.raises(ValueError):
+        init_job(str(tmp_path), 30, "suit", "S", seed=0, num_shards=2)
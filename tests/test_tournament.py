@@ -0,0 +1,93 @@
+import math
+
+import pytest
+
+from src.cards import effective_suit, rank_strength
+from src.strategy import choose_card_basic
+from src.tournament import CONTRACTS, _play_duplicate_batch, run_duplicate_tournament
+
+
+def play_high(hand, plays_so_far, contract_type, trump_suit, player_index):
+    """Highest card that follows suit (no tracker parameter)."""
+    if plays_so_far:
+        led = effective_suit(plays_so_far[0][1], trump_suit, contract_type)
+        legal = [
+            i for i, c in enumerate(hand)
+            if effective_suit(c, trump_suit, contract_type) == led
+        ]
+    else:
+        legal = []
+    legal = legal or list(range(len(hand)))
+    return max(legal, key=lambda i: rank_strength(hand[i], contract_type))
+
+
+def revoke(hand, plays_so_far, contract_type, trump_suit, player_index, tracker=None):
+    """Plays off-suit whenever it can, even while holding the led suit."""
+    if plays_so_far:
+        led = effective_suit(plays_so_far[0][1], trump_suit, contract_type)
+        for i, c in enumerate(hand):
+            if effective_suit(c, trump_suit, contract_type) != led:
+                return i
+    return 0
+
+
+def out_of_range(hand, plays_so_far, contract_type, trump_suit, player_index):
+    return len(hand)
+
+
+def test_self_play_scores_zero():
+    r = run_duplicate_tournament(choose_card_basic, choose_card_basic, n_deals=20, workers=1)
+    assert all(c["mean_diff"] == 0 for c in r["contracts"].values())
+    assert r["bots"] == ("choose_card_basic (A)", "choose_card_basic (B)")
+
+
+def test_swapping_bots_flips_sign():
+    ab = run_duplicate_tournament(play_high, choose_card_basic, n_deals=30, workers=1)
+    ba = run_duplicate_tournament(choose_card_basic, play_high, n_deals=30, workers=1)
+
+    for _, _, label in CONTRACTS:
+        assert ba["contracts"][label]["mean_diff"] == -ab["contracts"][label]["mean_diff"]
+        assert ba["contracts"][label]["std_err"] == ab["contracts"][label]["std_err"]
+    assert any(c["mean_diff"] != 0 for c in ab["contracts"].values())
+
+
+def test_batch_size_does_not_change_result():
+    one = run_duplicate_tournament(play_high, choose_card_basic, n_deals=10, seed=4, workers=1, batch_size=1)
+    many = run_duplicate_tournament(play_high, choose_card_basic, n_deals=10, seed=4, workers=1, batch_size=7)
+    assert one["contracts"] == many["contracts"]
+
+
+def test_pool_matches_in_process():
+    pooled = run_duplicate_tournament(play_high, choose_card_basic, n_deals=12, workers=2, batch_size=5)
+    inline = run_duplicate_tournament(play_high, choose_card_basic, n_deals=12, workers=1, batch_size=5)
+    assert pooled["contracts"] == inline["contracts"]
+
+
+def test_decisions_per_deal():
+    # Each bot holds two seats per table (2 * 10 = 20 decisions), and every
+    # deal is played at two tables
+    _, (a_sec, a_dec), (b_sec, b_dec) = _play_duplicate_batch(
+        play_high, choose_card_basic, "suit", "H", 0, 0, 3,
+    )
+    assert a_dec == b_dec == 20 * 2 * 3
+    assert a_sec > 0 and b_sec > 0
+
+    r = run_duplicate_tournament(play_high, choose_card_basic, n_deals=2, workers=1)
+    assert all(sec > 0 for sec in r["time_per_decision"].values())
+
+
+def test_single_deal_has_nan_std_err():
+    r = run_duplicate_tournament(play_high, choose_card_basic, n_deals=1, workers=1)
+    assert all(math.isnan(c["std_err"]) for c in r["contracts"].values())
+
+
+@pytest.mark.parametrize("kwargs", [{"n_deals": 0}, {"batch_size": 0}])
+def test_bad_arguments_rejected(kwargs):
+    with pytest.raises(ValueError):
+        run_duplicate_tournament(choose_card_basic, choose_card_basic, workers=1, **kwargs)
+
+
+@pytest.mark.parametrize("bot", [revoke, out_of_range])
+def test_illegal_play_rejected(bot):
+    with pytest.raises(ValueError, match=bot.__name__):
+        run_duplicate_tournament(bot, choose_card_basic, n_deals=5, workers=1)
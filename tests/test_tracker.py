@@ -0,0 +1,121 @@
+from collections import Counter
+
+import pytest
+
+from src.cards import Card, SUITS, RANKS, create_deck, shuffle_deck, deal_hands, effective_suit
+from src.rules import trick_winner
+from src.simulation import hand_rng, play_dealt_hand
+from src.strategy import accepts_tracker, choose_card_basic
+from src.tracker import CardTracker
+
+
+# Strongest-first order per effective suit with hearts trump:
+# J♦ is the left bower, so it joins hearts and diamonds loses its jack.
+ORDER_H = {
+    "H": ["JH", "JD", "AH", "KH", "QH", "TH"],
+    "D": ["AD", "KD", "QD", "TD"],
+    "C": ["AC", "KC", "QC", "JC", "TC"],
+    "S": ["AS", "KS", "QS", "JS", "TS"],
+}
+
+
+def _card(text):
+    return Card(text[1], text[0])
+
+
+def test_left_bower_belongs_to_trump():
+    tracker = CardTracker("suit", "H")
+
+    assert tracker.highest_remaining("H") == _card("JH")
+    assert tracker.highest_remaining("D") == _card("AD")
+    assert tracker.remaining_in_suit("H") == 12
+    assert tracker.remaining_in_suit("D") == 8
+    assert tracker.trump_remaining() == 12
+
+    for player in range(2):
+        tracker.record_play(player, _card("JH"), [(0, _card("JH"))] if player else [])
+    assert tracker.highest_remaining("H") == _card("JD")
+    assert tracker.trump_remaining() == 10
+
+    # Following a heart lead with the left bower is following suit
+    tracker.record_play(2, _card("JD"), [(0, _card("JH"))])
+    assert not tracker.is_void(2, "H")
+    assert tracker.remaining_in_suit("D") == 8
+
+
+def test_seeded_hand_matches_recount():
+    contract_type, trump_suit = "suit", "H"
+
+    deck = create_deck()
+    shuffle_deck(deck, hand_rng(11, 0))
+    hands = deal_hands(deck, num_players=4, hand_size=10)
+
+    tracker = CardTracker(contract_type, trump_suit)
+    played = Counter()
+    voids = [set() for _ in range(4)]
+    leader = 0
+
+    for _ in range(10):
+        plays = []
+        for offset in range(4):
+            player = (leader + offset) % 4
+            hand = hands[player]
+            card = hand.pop(choose_card_basic(
+                hand, plays, contract_type, trump_suit, player, tracker=tracker,
+            ))
+
+            if plays:
+                led = effective_suit(plays[0][1], trump_suit, contract_type)
+                if effective_suit(card, trump_suit, contract_type) != led:
+                    voids[player].add(led)
+
+            tracker.record_play(player, card, plays)
+            plays.append((player, card))
+            played[card] += 1
+
+            for suit in SUITS:
+                left = [
+                    _card(c) for c in ORDER_H[suit] if played[_card(c)] < 2
+                ]
+                assert tracker.highest_remaining(suit) == (left[0] if left else None)
+                assert tracker.remaining_in_suit(suit) == sum(
+                    2 - played[_card(c)] for c in ORDER_H[suit]
+                )
+            assert tracker.trump_remaining() == tracker.remaining_in_suit("H")
+            for seat in range(4):
+                assert tracker.voids(seat) == voids[seat]
+
+        leader = trick_winner(plays, contract_type, trump_suit)
+
+    assert all(
+        tracker.remaining(Card(s, r)) == 0 for s in SUITS for r in RANKS
+    )
+    assert tracker.trump_remaining() == 0
+
+
+def test_strategy_without_tracker_parameter():
+    def old_signature(hand, plays_so_far, contract_type, trump_suit, player_index):
+        return choose_card_basic(hand, plays_so_far, contract_type, trump_suit, player_index)
+
+    seen = []
+
+    def counting(hand, plays_so_far, contract_type, trump_suit, player_index, tracker=None):
+        seen.append(tracker)
+        return choose_card_basic(hand, plays_so_far, contract_type, trump_suit, player_index)
+
+    assert not accepts_tracker(old_signature)
+    assert accepts_tracker(counting)
+
+    deck = create_deck()
+    shuffle_deck(deck, hand_rng(2, 0))
+    play_dealt_hand(
+        deal_hands(deck), "suit", "S",
+        [old_signature, counting, old_signature, counting],
+    )
+    assert len(seen) == 20
+    assert all(isinstance(t, CardTracker) for t in seen)
+
+
+def test_no_trump_contract_rejects_trump_suit():
+    with pytest.raises(ValueError):
+        CardTracker("high", "H")